@@ -1,11 +1,12 @@
+import sys
 from datetime import datetime
 
-from models import Cardio, Nutrition, Bodyweight
+from models import DATE_FORMAT, Workout, Cardio, Nutrition, Bodyweight, parse_bool
 from tracker import FitnessTracker
 
 
 def today_str() -> str:
-    return datetime.now().strftime("%Y-%m-%d")
+    return datetime.now().strftime(DATE_FORMAT)
 
 
 class TrackerCLI:
@@ -17,6 +18,15 @@ class TrackerCLI:
     Attributes:
         tracker (FitnessTracker): The FitnessTracker class used for backend tracker logic.
     """
+    MENU = (
+        "\nFitness Tracker\n"
+        "1. Log workout (one exercise, multiple sets)\n"
+        "2. Log cardio\n"
+        "3. Log nutrition\n"
+        "4. Log bodyweight\n"
+        "5. Exit\n"
+    )
+
     def __init__(self, tracker: FitnessTracker):
         """
         Initializes the CLI with a specific backend tracker.
@@ -25,6 +35,47 @@ class TrackerCLI:
             tracker (FitnessTracker): The logic engine used to save and retrieve data.
         """
         self.tracker = tracker
+        self._interactive = sys.stdin.isatty()
+        self._today = ""
+        self._today_prompt = ""
+
+    def _read(self, prompt: str) -> str:
+        """
+        Reads one line of user input.
+
+        When stdin is piped (e.g. a script feeding many entries) the prompt is skipped and lines are read straight from the buffered stream.
+
+        Args:
+            prompt (str): The text shown to an interactive user.
+
+        Returns:
+            str: The line entered, without the trailing newline.
+
+        Raises:
+            EOFError: If there is no more input.
+        """
+        if self._interactive:
+            return input(prompt)
+
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.rstrip("\n")
+
+    def _read_date(self) -> str:
+        """
+        Prompts for an entry date, defaulting to today.
+
+        The prompt text is built once and only rebuilt when the date changes.
+
+        Returns:
+            str: The date entered, or today's date if left blank.
+        """
+        today = today_str()
+        if today != self._today:
+            self._today = today
+            self._today_prompt = f"Date (YYYY-MM-DD) [default {today}]: "
+        return self._read(self._today_prompt).strip() or today
 
     def run(self) -> None:
         """
@@ -33,27 +84,28 @@ class TrackerCLI:
         Displays the menu and dispatches user choices to the appropiate logging method.
         """
         while True:
-            print("\nFitness Tracker")
-            print("1. Log workout (one exercise, multiple sets)")
-            print("2. Log cardio")
-            print("3. Log nutrition")
-            print("4. Log bodyweight")
-            print("5. Exit")
-
-            choice = input("Choose: ").strip()
-
-            if choice == "1" or choice == "Log workout":
-                self._log_workout()
-            elif choice == "2" or choice == "Log cardio":
-                self._log_cardio()
-            elif choice == "3" or choice == "Log nutrition":
-                self._log_nutrition()
-            elif choice == "4" or choice == "Log bodyweight":
-                self._log_bodyweight()
-            elif choice == "5" or choice == "Exit":
+            sys.stdout.write(self.MENU)
+
+            try:
+                choice = self._read("Choose: ").strip()
+
+                if choice == "1" or choice == "Log workout":
+                    self._log_workout()
+                elif choice == "2" or choice == "Log cardio":
+                    self._log_cardio()
+                elif choice == "3" or choice == "Log nutrition":
+                    self._log_nutrition()
+                elif choice == "4" or choice == "Log bodyweight":
+                    self._log_bodyweight()
+                elif choice == "5" or choice == "Exit":
+                    self.tracker.store.flush()
+                    break
+                else:
+                    print("❌ Invalid choice")
+            except EOFError:
+                # Piped input ran out: treat it like choosing Exit
+                self.tracker.store.flush()
                 break
-            else:
-                print("❌ Invalid choice")
 
     # -------- Loggers --------
     def _log_workout(self) -> None:
@@ -63,57 +115,67 @@ class TrackerCLI:
         Handles a multi-step input process:
             1. Prompts for date and exercise name
             2. Loops to collect sets, reps, and weights.
-            3. Passes the data to the tracker.
+            3. Saves every exercise of the session to the store in a single append.
         """
         self.tracker.show_last_workouts()
 
-        date = input(f"Date (YYYY-MM-DD) [default {today_str()}]: ").strip() or today_str()
+        date = self._read_date()
         
         print("\n--- Logging Workout ---")
 
-        while True:
-            exercise = input("Exercise: ").strip()
-            if not exercise:
-                print("✅ Workout complete.")
-                break
-
-            try:
-                num_sets = int(input("How many sets? ").strip())
-                if num_sets <= 0:
-                    print("❌ Sets must be > 0")
-                    continue
-            except ValueError:
-                print("❌ Enter a valid integer for sets.")
-                continue
+        all_sets = []
+        try:
+            while True:
+                exercise = self._read("Exercise: ").strip()
+                if not exercise:
+                    print("✅ Workout complete.")
+                    break
 
-            sets = []
-            for i in range(1, num_sets + 1):
                 try:
-                    reps = int(input(f"Set {i} reps: ").strip())
-                    weight = float(input(f"Set {i} weight: ").strip())
-                    sets.append((reps, weight))
+                    num_sets = int(self._read("How many sets? ").strip())
+                    if num_sets <= 0:
+                        print("❌ Sets must be > 0")
+                        continue
                 except ValueError:
-                    print("❌ Invalid reps/weight. Aborting entry.")
-                    return
+                    print("❌ Enter a valid integer for sets.")
+                    continue
+
+                sets = []
+                for i in range(1, num_sets + 1):
+                    try:
+                        reps = int(self._read(f"Set {i} reps: ").strip())
+                        weight = float(self._read(f"Set {i} weight: ").strip())
+                        sets.append((reps, weight))
+                    except ValueError:
+                        print("❌ Invalid reps/weight. Aborting entry.")
+                        return
             
-            if not sets:
-                continue
-
-            notes = input("Notes (optional): ").strip()
-            self.tracker.log_workout(
-                date=date, 
-                exercise=exercise, 
-                sets=sets, 
-                notes=notes
-            )
+                if not sets:
+                    continue
+
+                notes = self._read("Notes (optional): ").strip()
+                for i, (reps, weight) in enumerate(sets, start=1):
+                    all_sets.append(
+                        Workout(
+                            date=date,
+                            exercise=exercise,
+                            set_number=i,
+                            reps=reps,
+                            weight=weight,
+                            notes=notes
+                        )
+                    )
             
-            print(f"✅ Saved {exercise} for {date}")
+                print(f"✅ Saved {exercise} for {date}")
         
 
-            again = input("Add another exercise? (y/n): ").strip().lower()
-            if again != "y":
-                print("✅ Workout saved.")
-                break
+                again = self._read("Add another exercise? (y/n): ").strip().lower()
+                if again != "y":
+                    print("✅ Workout saved.")
+                    break
+        finally:
+            # Keeps the exercises already entered even if the session is aborted
+            self.tracker.log_workouts_batch(all_sets)
 
     def _log_cardio(self) -> None:
         """
@@ -125,16 +187,16 @@ class TrackerCLI:
         """
         self.tracker.show_last_cardio()
 
-        date = input(f"Date (YYYY-MM-DD) [default {today_str()}]: ").strip() or today_str()
-        cardio_type = input("Cardio type (walk, run, bike, etc.): ").strip()
+        date = self._read_date()
+        cardio_type = self._read("Cardio type (walk, run, bike, etc.): ").strip()
 
         try:
-            duration = float(input("Duration (min): ").strip())
+            duration = float(self._read("Duration (min): ").strip())
         except ValueError:
             print("❌ Enter a valid number for duration.")
             return
 
-        notes = input("Notes (optional): ").strip()
+        notes = self._read("Notes (optional): ").strip()
 
         entry = Cardio(
             date=date, 
@@ -157,19 +219,19 @@ class TrackerCLI:
         """
         self.tracker.show_last_nutrition()
 
-        date = input(f"Date (YYYY-MM-DD) [default {today_str()}]: ").strip() or today_str()
+        date = self._read_date()
 
         try:
-            calories = int(input("Calories: ").strip())
-            protein = int(input("Protein (g): ").strip())
-            carbs = int(input("Carbs (g): ").strip())
-            fats = int(input("Fats (g): ").strip())
-            tracked = bool(input("Track everything? (TRUE/FALSE) "))
+            calories = int(self._read("Calories: ").strip())
+            protein = int(self._read("Protein (g): ").strip())
+            carbs = int(self._read("Carbs (g): ").strip())
+            fats = int(self._read("Fats (g): ").strip())
+            tracked = parse_bool(self._read("Track everything? (TRUE/FALSE) "))
         except ValueError:
-            print("❌ Enter valid integers for calories/protein.")
+            print("❌ Enter valid integers for calories/protein and TRUE/FALSE for tracked.")
             return
 
-        notes = input("Notes (optional): ").strip()
+        notes = self._read("Notes (optional): ").strip()
 
         entry = Nutrition(
             date=date, 
@@ -195,15 +257,15 @@ class TrackerCLI:
         """
         self.tracker.show_last_bodyweights()
 
-        date = input(f"Date (YYYY-MM-DD) [default {today_str()}]: ").strip() or today_str()
+        date = self._read_date()
 
         try:
-            weight = float(input("Bodyweight: ").strip())
+            weight = float(self._read("Bodyweight: ").strip())
         except ValueError:
             print("❌ Enter a valid number for bodyweight.")
             return
 
-        notes = input("Notes (optional): ")
+        notes = self._read("Notes (optional): ")
         entry = Bodyweight(
             date=date, 
             weight=weight, 
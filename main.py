@@ -1,13 +1,71 @@
-from storage import ExcelStore
+import argparse
+import os
+
+from storage import SQLiteStore
 from tracker import FitnessTracker
 from cli import TrackerCLI
 
+DB_FILE = "fitness_tracker.db"
+EXCEL_FILE = "fitness_tracker.xlsx"
+EXPORT_FILE = "fitness_tracker_export.xlsx"
+
+
+def _remove_db(filename: str) -> None:
+    """
+    Deletes a SQLite database along with its WAL side files.
+    """
+    for path in (filename, filename + "-wal", filename + "-shm"):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def open_store(db_file: str = DB_FILE, excel_file: str = EXCEL_FILE) -> SQLiteStore:
+    """
+    Opens the database, migrating an existing excel file into it the first time.
+
+    The import is written to a temporary database that only replaces db_file once every sheet was copied, so a failed import never leaves a half-empty database that would hide the excel data on the next run.
+
+    Arguments:
+        db_file (str): The SQLite database file.
+        excel_file (str): The excel file written by earlier versions of the tracker.
+
+    Returns:
+        SQLiteStore: The opened store.
+    """
+    if not os.path.exists(db_file) and os.path.exists(excel_file):
+        tmp_file = db_file + ".importing"
+        _remove_db(tmp_file)
+        try:
+            with SQLiteStore(tmp_file) as store:
+                store.import_xlsx(excel_file)
+            os.replace(tmp_file, db_file)
+        except BaseException:
+            _remove_db(tmp_file)
+            raise
+
+    return SQLiteStore(db_file)
+
 
 def main():
-    store = ExcelStore("fitness_tracker.xlsx")
-    tracker = FitnessTracker(store)
-    app = TrackerCLI(tracker)
-    app.run()
+    parser = argparse.ArgumentParser(description="Fitness Tracker CLI")
+    parser.add_argument(
+        "--export",
+        nargs="?",
+        const=EXPORT_FILE,
+        metavar="FILE",
+        help=f"write every sheet to an excel file (default {EXPORT_FILE}) and exit"
+    )
+    args = parser.parse_args()
+
+    with open_store() as store:
+        if args.export:
+            store.export_xlsx(args.export)
+            print(f"✅ Exported to {args.export}")
+            return
+
+        tracker = FitnessTracker(store)
+        app = TrackerCLI(tracker)
+        app.run()
 
 
 if __name__ == "__main__":
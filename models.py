@@ -1,8 +1,36 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, List, Tuple
 
+# Every model stores its date as a string in this format
+DATE_FORMAT = "%Y-%m-%d"
 
-@dataclass
+
+def parse_bool(value: Any) -> bool:
+    """
+    Converts a yes/no value from user input or an imported file into a bool.
+
+    Arguments:
+        value (Any): A bool, 0/1, or one of the strings "true", "false", "1", "0" (any case, surrounding spaces ignored).
+
+    Returns:
+        bool: The parsed value.
+
+    Raises:
+        ValueError: If the value is not one of the accepted forms.
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in ("true", "1"):
+            return True
+        if text in ("false", "0"):
+            return False
+    raise ValueError(f"Expected TRUE or FALSE, got {value!r}")
+
+@dataclass(slots=True)
 class Workout:
     """
     Represents a single set within a workout session. This class serves as a data model for indiviudal exercise entries.
@@ -22,6 +50,14 @@ class Workout:
     weight: float
     notes: str = ""
 
+    def __post_init__(self) -> None:
+        """
+        Casts the numeric fields so they are written to the sheet as numbers.
+        """
+        self.set_number = int(self.set_number)
+        self.reps = int(self.reps)
+        self.weight = float(self.weight)
+
     @staticmethod
     def sheet_name() -> str:
         """
@@ -42,23 +78,23 @@ class Workout:
         """
         return ["Date", "Exercise", "SetNumber", "Reps", "Weight", "Notes"]
 
-    def to_row(self) -> Dict[str, Any]:
+    def to_values(self) -> Tuple[Any, ...]:
         """
-        Used for inserting data into the spreadsheet or dataframes.
+        Used for inserting data into the spreadsheet or database.
 
         Returns:
-            Dict[str, Any]: A mapping of column names to workout attributions.
-        """
-        return {
-            "Date": self.date,
-            "Exercise": self.exercise,
-            "SetNumber": self.set_number,
-            "Reps": self.reps,
-            "Weight": self.weight,
-            "Notes": self.notes,
-        }
-
-@dataclass
+            Tuple[Any, ...]: The workout attributes in the same order as columns().
+        """
+        return (
+            self.date,
+            self.exercise,
+            self.set_number,
+            self.reps,
+            self.weight,
+            self.notes,
+        )
+
+@dataclass(slots=True)
 class Cardio:
     """
     Represents a single cardio session. This class serves as a data model for indiviudal cardio entries.
@@ -74,6 +110,12 @@ class Cardio:
     duration: float
     notes: str = ""
 
+    def __post_init__(self) -> None:
+        """
+        Casts the numeric fields so they are written to the sheet as numbers.
+        """
+        self.duration = float(self.duration)
+
     @staticmethod
     def sheet_name() -> str:
         """
@@ -94,21 +136,21 @@ class Cardio:
         """
         return ["Date", "Cardio Type", "Duration", "Notes"]
     
-    def to_row(self) -> Dict[str, Any]:
+    def to_values(self) -> Tuple[Any, ...]:
         """
-        Used for inserting data into the spreadsheet or dataframes.
+        Used for inserting data into the spreadsheet or database.
 
         Returns:
-            Dict[str, Any]: A mapping of column names to workout attributions.
+            Tuple[Any, ...]: The cardio attributes in the same order as columns().
         """
-        return{
-            "Date": self.date,
-            "Cardio Type": self.cardio_type,
-            "Duration": self.duration,
-            "Notes": self.notes
-        }
+        return (
+            self.date,
+            self.cardio_type,
+            self.duration,
+            self.notes,
+        )
 
-@dataclass   
+@dataclass(slots=True)
 class Nutrition:
     """
     Represents a full day of eating. This class serves as a data model for indiviudal nutrition entries.
@@ -130,6 +172,16 @@ class Nutrition:
     tracked: bool
     notes: str = ""
 
+    def __post_init__(self) -> None:
+        """
+        Casts the numeric fields so they are written to the sheet as numbers, and parses tracked into a bool.
+        """
+        self.calories = int(self.calories)
+        self.protein = int(self.protein)
+        self.carbs = int(self.carbs)
+        self.fats = int(self.fats)
+        self.tracked = parse_bool(self.tracked)
+
     @staticmethod
     def sheet_name() -> str:
         """
@@ -150,24 +202,24 @@ class Nutrition:
         """
         return ["Date", "Calories", "Protein", "Carbs", "Fats", "Tracked?", "Notes"]
     
-    def to_row(self) -> Dict[str, Any]:
+    def to_values(self) -> Tuple[Any, ...]:
         """
-        Used for inserting data into the spreadsheet or dataframes.
+        Used for inserting data into the spreadsheet or database.
 
         Returns:
-            Dict[str, Any]: A mapping of column names to workout attributions.
-        """
-        return{
-            "Date": self.date,
-            "Calories": self.calories,
-            "Protein": self.protein,
-            "Carbs": self.carbs,
-            "Fats": self.fats,
-            "Tracked?": self.tracked,
-            "Notes": self.notes
-        }
+            Tuple[Any, ...]: The nutrition attributes in the same order as columns().
+        """
+        return (
+            self.date,
+            self.calories,
+            self.protein,
+            self.carbs,
+            self.fats,
+            self.tracked,
+            self.notes,
+        )
     
-@dataclass
+@dataclass(slots=True)
 class Bodyweight:
     """
     Represents a single bodyweight entry. This class serves as a data model for indiviudal bodyweight entries.
@@ -181,6 +233,12 @@ class Bodyweight:
     weight: float
     notes: str = ""
 
+    def __post_init__(self) -> None:
+        """
+        Casts the numeric fields so they are written to the sheet as numbers.
+        """
+        self.weight = float(self.weight)
+
     @staticmethod
     def sheet_name() -> str:
         """
@@ -201,17 +259,17 @@ class Bodyweight:
         """
         return ["Date", "Weight", "Notes"]
     
-    def to_row(self) -> Dict[str, Any]:
+    def to_values(self) -> Tuple[Any, ...]:
         """
-        Used for inserting data into the spreadsheet or dataframes.
+        Used for inserting data into the spreadsheet or database.
 
         Returns:
-            Dict[str, Any]: A mapping of column names to workout attributions.
+            Tuple[Any, ...]: The bodyweight attributes in the same order as columns().
         """
-        return{
-            "Date": self.date,
-            "Weight": self.weight,
-            "Notes": self.notes
-        }
+        return (
+            self.date,
+            self.weight,
+            self.notes,
+        )
 
 
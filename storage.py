@@ -1,13 +1,34 @@
+import atexit
+import itertools
 import os
-from typing import Any, Dict, List
+import sqlite3
+import warnings
+from contextlib import contextmanager
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
 
 import pandas as pd
-from openpyxl import load_workbook
-from openpyxl.utils.dataframe import dataframe_to_rows
+
+from models import DATE_FORMAT
+
+try:
+    # fastpyxl is an API-compatible, faster fork of openpyxl; use it when installed.
+    from fastpyxl import Workbook, load_workbook
+except ImportError:
+    from openpyxl import Workbook, load_workbook
+
+try:
+    # PyExcelerate writes a whole new file much faster than openpyxl; use it when installed.
+    from pyexcelerate import Workbook as PXWorkbook
+except ImportError:
+    PXWorkbook = None
 
 class ExcelStore:
     """
     Represents how inputs from the user will be stored.
+
+    The loaded workbook is kept in memory between calls, so appends only edit the cached copy. Call flush() to write it back to the excel file; leaving a `with ExcelStore(...)` block or exiting the program also does this.
+
     Attributes:
         filename (str): The name of the excel file where data is stored.
     """
@@ -19,25 +40,74 @@ class ExcelStore:
             filename (str): The name of the excel file where data is stored.
         """
         self.filename = filename
+        self._wb = None
+        self._dirty = False
+        self._mtime = 0.0
+        self._read_cache: Dict[str, Tuple[float, pd.DataFrame]] = {}
+        atexit.register(self.flush)
+
+    def __enter__(self) -> "ExcelStore":
+        return self
 
-    def _sheet_exists(self, sheet_name: str) -> bool:
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.flush()
+        # Nothing left to save, so the exit hook would only keep this store alive
+        atexit.unregister(self.flush)
+
+    def _cache_is_fresh(self) -> bool:
         """
-        Validates that the sheet exists.
-        
-        Arguments:
-            sheet_name (str): The specific sheet that the user is trying to access. 
+        Checks whether the cached workbook can be used without reloading the file.
         """
-        if not os.path.exists(self.filename):
-            return False
-        try:
-            pd.read_excel(self.filename, sheet_name=sheet_name, nrows=1)
-            return True
-        except Exception:
+        if self._wb is None:
             return False
+        return self._dirty or os.path.getmtime(self.filename) == self._mtime
+
+    def _get_wb(self) -> Workbook:
+        """
+        Returns the cached workbook, reloading it if the file changed on disk since it was loaded.
+
+        Unsaved appends are never discarded: a dirty workbook is always returned as is.
+        """
+        if self._cache_is_fresh():
+            return self._wb
+
+        self._wb = _load_workbook(self.filename)
+        self._mtime = os.path.getmtime(self.filename)
+        self._dirty = False
+        return self._wb
+
+    def _get_sheet(self, sheet_name: str):
+        """
+        Returns a worksheet of the cached workbook, or None if the file or the sheet does not exist.
+
+        The workbook is loaded (at most) once and its sheetnames checked, rather than probing the file first and loading it again.
+
+        Arguments:
+            sheet_name (str): The specific sheet that the user is trying to access.
+        """
+        if not self._dirty and not os.path.exists(self.filename):
+            return None
+
+        wb = self._get_wb()
+        if sheet_name not in wb.sheetnames:
+            return None
+        return wb[sheet_name]
+
+    def flush(self) -> None:
+        """
+        Saves the cached workbook to the excel file if it has unsaved changes.
+        """
+        if self._wb is None or not self._dirty:
+            return
+        self._wb.save(self.filename)
+        self._mtime = os.path.getmtime(self.filename)
+        self._dirty = False
 
     def read_sheet(self, sheet_name: str) -> pd.DataFrame:
         """
-        Uses Pandas read_excel to return a Pandas DataFrame.
+        Reads a sheet of the cached workbook into a Pandas DataFrame, including rows that have not been flushed yet.
+
+        The DataFrame is memoized per sheet until the file changes or the sheet is appended to; callers get a copy they can modify.
 
         Arguments:
             sheet_name (str): The specific sheet that the user is trying to access.
@@ -45,52 +115,60 @@ class ExcelStore:
         Returns:
             pd.DataFrame: The sheet of an excel file that is turned into a Pandas DataFrame.
         """
-        if not os.path.exists(self.filename):
+        if not self._dirty and not os.path.exists(self.filename):
             return pd.DataFrame()
-        try:
-            return pd.read_excel(self.filename, sheet_name=sheet_name)
-        except Exception:
+
+        mtime = os.path.getmtime(self.filename)
+        cached = self._read_cache.get(sheet_name)
+        if cached is not None and cached[0] == mtime:
+            return cached[1].copy()
+
+        ws = self._get_sheet(sheet_name)
+        if ws is None:
+            return pd.DataFrame()
+
+        values = ws.values
+        header = next(values, None)
+        if header is None:
             return pd.DataFrame()
 
-    def append_rows(self, sheet_name: str, columns: List[str], rows: List[Dict[str, Any]]) -> None:
+        df = pd.DataFrame(list(values), columns=header)
+        self._read_cache[sheet_name] = (mtime, df)
+        return df.copy()
+
+    def append_rows(self, sheet_name: str, columns: List[str], rows: List[Tuple[Any, ...]]) -> None:
         """
-        Uses Pandas and Openpyxl to add rows of data to the specific sheet in the excel file.
+        Uses Openpyxl to add rows of data to the specific sheet in the excel file.
+
+        Rows are added to the cached workbook and written to disk by flush(). Only the very first append, which creates the file, saves immediately.
 
         Arguments:
             sheet_name (str): The specific sheet the user is trying to add data to.
             columns (List[str]): A list of headers for the sheet.
-            rows (List[Dict[str, Any]]): A list of a dictionary including all of the current rows.
+            rows (List[Tuple[Any, ...]]): A list of row values, each in the same order as columns (see the models' to_values()).
         """
-        new_df = pd.DataFrame(rows, columns=columns)
-
-        file_exists = os.path.exists(self.filename)
-        sheet_exists = self._sheet_exists(sheet_name)
+        self._read_cache.pop(sheet_name, None)
 
-        if not file_exists:
-            # First time: let pandas create file + sheet
-            with pd.ExcelWriter(self.filename, engine="openpyxl", mode="w") as writer:
-                new_df.to_excel(writer, sheet_name=sheet_name, index=False)
+        if not self._dirty and not os.path.exists(self.filename):
+            # First time: bulk-write the file + sheet in one go
+            _write_new_workbook(self.filename, [(sheet_name, [columns, *rows])])
+            self._wb = None
             return
 
         # File exists → use openpyxl to preserve formatting
-        wb = load_workbook(self.filename)
+        wb = self._get_wb()
 
-        if sheet_exists:
+        if sheet_name in wb.sheetnames:
             ws = wb[sheet_name]
-            start_row = ws.max_row + 1
         else:
             ws = wb.create_sheet(sheet_name)
-            start_row = 1
+            ws.append(columns)
 
-        for r_idx, row in enumerate(
-            dataframe_to_rows(new_df, index=False, header=not sheet_exists),
-            start=start_row
-        ):
-            for c_idx, value in enumerate(row, start=1):
-                ws.cell(row=r_idx, column=c_idx, value=value)
+        for row in rows:
+            ws.append(row)
+
+        self._dirty = True
 
-        wb.save(self.filename)
-        
     def get_last_entries(self, sheet_name: str, n: int = 5) -> None:
         """
         Gets the last 5 entries of a sheet.
@@ -98,35 +176,395 @@ class ExcelStore:
         Arguments:
             sheet_name (str): The specific sheet the user is trying to add data to.
             n (int) = 5: Last 5 entries in the sheet.
-        """
-        df = self.read_sheet(sheet_name)
 
-        if df.empty:
-            print(f"❗ No entries found in '{sheet_name}'.")
+        Rows are appended in chronological order, so only the last 2n rows are read (the extra rows cover a few entries logged out of order) instead of the whole sheet.
+        """
+        ws = self._get_sheet(sheet_name)
+        if ws is None:
+            _print_last_entries(pd.DataFrame(), sheet_name, n)
             return
 
-        if "Date" not in df.columns:
-            print(f"❌ Sheet '{sheet_name}' missing required 'Date' column.")
+        header = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), None)
+        if header is None:
+            _print_last_entries(pd.DataFrame(), sheet_name, n)
             return
 
-        df["Date"] = pd.to_datetime(df["Date"], errors="coerce")
+        first = max(2, ws.max_row - 2 * n + 1)
+        tail = ws.iter_rows(min_row=first, max_row=ws.max_row, values_only=True)
+        _print_last_entries(pd.DataFrame(list(tail), columns=header), sheet_name, n)
+
+
+class SQLiteStore:
+    """
+    Represents how inputs from the user will be stored, using a SQLite database.
+
+    Each sheet name maps to its own table, so appending a row is a single insert instead of rewriting a whole excel file. The data can be exported to an excel file on demand.
+
+    Attributes:
+        filename (str): The name of the SQLite database file where data is stored.
+        conn (sqlite3.Connection): The open connection to the database.
+    """
+    def __init__(self, filename: str):
+        """
+        Opens (or creates) the database.
+
+        Arguments:
+            filename (str): The name of the SQLite database file where data is stored.
+        """
+        self.filename = filename
+        self.conn = sqlite3.connect(filename, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+    def __enter__(self) -> "SQLiteStore":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _table_exists(self, sheet_name: str) -> bool:
+        """
+        Validates that the table for a sheet exists.
+
+        Arguments:
+            sheet_name (str): The specific sheet that the user is trying to access.
+        """
+        cur = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (sheet_name,)
+        )
+        return cur.fetchone() is not None
+
+    def sheet_names(self) -> List[str]:
+        """
+        Lists every sheet (table) stored in the database.
+
+        Returns:
+            List[str]: The sheet names in the order they were created.
+        """
+        cur = self.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY rowid"
+        )
+        return [name for (name,) in cur.fetchall()]
+
+    def _bool_columns(self, sheet_name: str) -> List[str]:
+        """
+        Lists the columns of a table that were declared BOOLEAN when it was created.
+
+        Arguments:
+            sheet_name (str): The specific sheet that the user is trying to access.
+        """
+        cur = self.conn.execute(f"PRAGMA table_info({_quote(sheet_name)})")
+        return [name for (_, name, declared, *_) in cur.fetchall() if declared.upper() == "BOOLEAN"]
+
+    def _query_sheet(self, sheet_name: str, sql: str, params: Tuple[Any, ...] = ()) -> pd.DataFrame:
+        """
+        Runs a query against a sheet's table, turning its BOOLEAN columns back into True/False.
+        """
+        df = pd.read_sql_query(sql, self.conn, params=params)
+        for column in self._bool_columns(sheet_name):
+            df[column] = df[column].map({1: True, 0: False})
+        return df
+
+    def read_sheet(self, sheet_name: str) -> pd.DataFrame:
+        """
+        Uses Pandas read_sql_query to return a Pandas DataFrame.
+
+        Arguments:
+            sheet_name (str): The specific sheet that the user is trying to access.
+
+        Returns:
+            pd.DataFrame: The table of the database that is turned into a Pandas DataFrame.
+        """
+        if not self._table_exists(sheet_name):
+            return pd.DataFrame()
+        return self._query_sheet(sheet_name, f"SELECT * FROM {_quote(sheet_name)}")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """
+        Runs the enclosed statements as one transaction: committed together, or rolled back if anything fails.
+        """
+        self.conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def append_rows(self, sheet_name: str, columns: List[str], rows: List[Tuple[Any, ...]]) -> None:
+        """
+        Inserts rows of data into the table for a specific sheet, creating the table on first use.
+
+        All rows are written in a single transaction, so a batch is stored completely or not at all.
 
-        recent = (
-            df
-            .dropna(subset=["Date"])
-            .sort_values("Date")
-            .tail(n)
+        Arguments:
+            sheet_name (str): The specific sheet the user is trying to add data to.
+            columns (List[str]): A list of headers for the sheet.
+            rows (List[Tuple[Any, ...]]): A list of row values, each in the same order as columns (see the models' to_values()).
+        """
+        with self._transaction():
+            self._insert_rows(sheet_name, columns, rows)
+
+    def _insert_rows(self, sheet_name: str, columns: List[str], rows: List[Tuple[Any, ...]]) -> None:
+        """
+        Creates the table if needed and inserts the rows, without managing the transaction.
+        """
+        table = _quote(sheet_name)
+        column_list = ", ".join(_quote(c) for c in columns)
+        placeholders = ", ".join("?" for _ in columns)
+
+        if not self._table_exists(sheet_name):
+            definitions = [_column_definition(c, i, rows) for i, c in enumerate(columns)]
+            self.conn.execute(f"CREATE TABLE {table} ({', '.join(definitions)})")
+        else:
+            # Tables imported from an old excel file may lack some of the model's columns
+            cur = self.conn.execute(f"PRAGMA table_info({table})")
+            existing = {name.lower() for (_, name, *_) in cur.fetchall()}
+            for i, column in enumerate(columns):
+                if column.lower() not in existing:
+                    self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {_column_definition(column, i, rows)}")
+        self.conn.executemany(
+            f"INSERT INTO {table} ({column_list}) VALUES ({placeholders})",
+            rows
         )
 
-        if recent.empty:
-            print("❗ No valid dated entries found.")
+    def get_last_entries(self, sheet_name: str, n: int = 5) -> None:
+        """
+        Gets the last 5 entries of a sheet.
+
+        Arguments:
+            sheet_name (str): The specific sheet the user is trying to add data to.
+            n (int) = 5: Last 5 entries in the sheet.
+
+        Rows are inserted in chronological order, so only the last 2n rows are queried (the extra rows cover a few entries logged out of order) instead of the whole table.
+        """
+        if not self._table_exists(sheet_name):
+            _print_last_entries(pd.DataFrame(), sheet_name, n)
             return
 
-        print(f"\n📋 Last {n} entries from '{sheet_name}':\n")
-        print(recent.to_string(index=False))
+        df = self._query_sheet(
+            sheet_name,
+            f"SELECT * FROM {_quote(sheet_name)} ORDER BY rowid DESC LIMIT ?",
+            (2 * n,)
+        )
+        _print_last_entries(df.iloc[::-1], sheet_name, n)
+
+    def export_xlsx(self, filename: str) -> None:
+        """
+        Writes every sheet to an excel file in one pass.
+
+        Arguments:
+            filename (str): The name of the excel file to create (overwritten if it exists).
+        """
+        sheet_names = self.sheet_names()
+        if sheet_names:
+            _write_new_workbook(filename, (self._export_rows(name) for name in sheet_names))
+
+    def _export_rows(self, sheet_name: str) -> Tuple[str, Iterator[Sequence[Any]]]:
+        """
+        Pairs a sheet name with a lazy iterator over its header and rows, so exports can stream straight from the cursor.
+        """
+        cur = self.conn.execute(f"SELECT * FROM {_quote(sheet_name)}")
+        header = [d[0] for d in cur.description]
+        bool_positions = [header.index(c) for c in self._bool_columns(sheet_name)]
+        rows = (_restore_bools(row, bool_positions) for row in cur)
+        return sheet_name, itertools.chain([header], rows)
+
+    def import_xlsx(self, filename: str) -> None:
+        """
+        Copies every sheet of an existing excel file into the database.
+
+        Used once to migrate data that was logged before the database existed. Every sheet is copied in one transaction, so a failed import leaves nothing behind. Cells Excel holds as dates are stored as DATE_FORMAT strings, like the dates the models write.
+
+        Arguments:
+            filename (str): The name of the excel file to read.
+        """
+        wb = _load_workbook(filename, read_only=True)
+        try:
+            with self._transaction():
+                for ws in wb.worksheets:
+                    values = ws.iter_rows(values_only=True)
+                    header = next(values, None)
+                    if not header:
+                        continue
+                    columns = _unique_columns(header)
+                    width = len(columns)
+                    self._insert_rows(
+                        ws.title,
+                        columns,
+                        [
+                            tuple(_import_value(v) for v in (tuple(row) + (None,) * width)[:width])
+                            for row in values if any(v is not None for v in row)
+                        ]
+                    )
+        finally:
+            wb.close()
+
+    def flush(self) -> None:
+        """
+        Kept so both stores share the same interface; rows are already committed as they are inserted.
+        """
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        self.conn.close()
+
+
+def _load_workbook(filename: str, **kwargs: Any) -> Workbook:
+    """
+    Calls load_workbook without the "no stylesheet" warning.
+
+    Files written by PyExcelerate have no stylesheet and the loader falls back to its defaults, which is fine here. The warning is only silenced for this call.
+    """
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="Workbook contains no stylesheet")
+        return load_workbook(filename, **kwargs)
+
+
+def _write_new_workbook(filename: str, sheets: Iterable[Tuple[str, Iterable[Sequence[Any]]]]) -> None:
+    """
+    Creates (or overwrites) an excel file from scratch.
+
+    Uses PyExcelerate when it is installed, which needs each sheet's rows in memory. Otherwise openpyxl's write-only mode is used, which streams the rows to disk as they are consumed.
+
+    Arguments:
+        filename (str): The name of the excel file to create.
+        sheets (Iterable[Tuple[str, Iterable[Sequence[Any]]]]): Pairs of sheet name and its rows, header row first. Both may be lazy iterators.
+    """
+    if PXWorkbook is not None:
+        wb = PXWorkbook()
+        for sheet_name, rows in sheets:
+            wb.new_sheet(sheet_name, data=[list(row) for row in rows])
+        wb.save(filename)
+        return
+
+    wb = Workbook(write_only=True)
+    for sheet_name, rows in sheets:
+        ws = wb.create_sheet(sheet_name)
+        for row in rows:
+            ws.append(row)
+    wb.save(filename)
+
+
+def _column_definition(column: str, position: int, rows: List[Tuple[Any, ...]]) -> str:
+    """
+    Builds the SQL definition of a new column.
+
+    SQLite stores booleans as 0/1, so a column whose first value is a bool is declared BOOLEAN; reads and exports use that to turn the values back.
+
+    Arguments:
+        column (str): The column name.
+        position (int): The column's index within each row.
+        rows (List[Tuple[Any, ...]]): The rows about to be inserted.
+    """
+    first = next((row[position] for row in rows if row[position] is not None), None)
+    declared = " BOOLEAN" if isinstance(first, bool) else ""
+    return _quote(column) + declared
+
+
+def _import_value(value: Any) -> Any:
+    """
+    Converts a cell read from excel into the value stored in the database (dates become DATE_FORMAT strings).
+    """
+    if isinstance(value, date):
+        return value.strftime(DATE_FORMAT)
+    return value
+
+
+def _restore_bools(row: Sequence[Any], positions: List[int]) -> Sequence[Any]:
+    """
+    Turns the 0/1 values SQLite stores for BOOLEAN columns back into True/False.
+
+    Arguments:
+        row (Sequence[Any]): One row read from a table.
+        positions (List[int]): The indexes of the row's BOOLEAN columns.
+    """
+    if not positions:
+        return row
+    values = list(row)
+    for i in positions:
+        if values[i] is not None:
+            values[i] = bool(values[i])
+    return values
+
+
+def _unique_columns(header: Sequence[Any]) -> List[str]:
+    """
+    Turns a header row read from excel into usable column names.
+
+    Blank headers are named after their position ("Column3") and repeated names get a numeric suffix ("Notes.1"), since SQLite rejects duplicate column names (case-insensitively).
+
+    Arguments:
+        header (Sequence[Any]): The cell values of the header row.
+
+    Returns:
+        List[str]: One unique name per header cell.
+    """
+    columns = []
+    seen = set()
+    for position, cell in enumerate(header, start=1):
+        base = str(cell).strip() if cell is not None else ""
+        base = base or f"Column{position}"
+
+        name = base
+        suffix = 1
+        while name.lower() in seen:
+            name = f"{base}.{suffix}"
+            suffix += 1
+
+        seen.add(name.lower())
+        columns.append(name)
+    return columns
+
+
+def _quote(identifier: str) -> str:
+    """
+    Quotes a sheet or column name so it can be used as a SQL identifier (handles names like "Tracked?").
+    """
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def sort_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sorts a sheet by its Date column, oldest first.
+
+    Dates are stored as DATE_FORMAT (YYYY-MM-DD) strings, which sort correctly as text, so they are not parsed. The sort is stable, keeping same-day entries in the order they were logged.
+
+    Arguments:
+        df (pd.DataFrame): A sheet with a Date column.
+
+    Returns:
+        pd.DataFrame: The sorted sheet.
+    """
+    return df.sort_values("Date", kind="mergesort", key=lambda dates: dates.astype(str))
+
+
+def _print_last_entries(df: pd.DataFrame, sheet_name: str, n: int) -> None:
+    """
+    Prints the n most recent dated entries of a sheet.
+
+    Arguments:
+        df (pd.DataFrame): The sheet contents.
+        sheet_name (str): The name of the sheet, used in the printed messages.
+        n (int): How many entries to print.
+    """
+    if df.empty:
+        print(f"❗ No entries found in '{sheet_name}'.")
+        return
+
+    if "Date" not in df.columns:
+        print(f"❌ Sheet '{sheet_name}' missing required 'Date' column.")
+        return
 
-        
+    recent = sort_by_date(df.dropna(subset=["Date"])).tail(n)
 
-        
+    if recent.empty:
+        print("❗ No valid dated entries found.")
+        return
 
-    
\ No newline at end of file
+    print(f"\n📋 Last {n} entries from '{sheet_name}':\n")
+    print(recent.to_string(index=False))
@@ -0,0 +1,96 @@
+import atexit
+import os
+
+import pytest
+
+from models import Bodyweight
+from storage import ExcelStore
+
+
+def _log(store, date, weight):
+    store.append_rows(Bodyweight.sheet_name(), Bodyweight.columns(), [Bodyweight(date, weight).to_values()])
+
+
+def _weights(store):
+    return store.read_sheet(Bodyweight.sheet_name())["Weight"].tolist()
+
+
+def _bump_mtime(filename):
+    # Guarantees a different mtime even on filesystems with coarse timestamps
+    stat = os.stat(filename)
+    os.utime(filename, (stat.st_atime, stat.st_mtime + 10))
+
+
+@pytest.fixture
+def filename(tmp_path):
+    return str(tmp_path / "tracker.xlsx")
+
+
+def test_read_sheet_sees_unflushed_rows(filename):
+    with ExcelStore(filename) as store:
+        _log(store, "2026-01-01", 80.0)
+        _log(store, "2026-01-02", 81.0)
+
+        assert store._dirty
+        assert _weights(store) == [80.0, 81.0]
+
+        _log(store, "2026-01-03", 82.0)
+        assert _weights(store) == [80.0, 81.0, 82.0]
+
+
+def test_flush_is_read_back_by_a_new_store(filename):
+    store = ExcelStore(filename)
+    _log(store, "2026-01-01", 80.0)
+    _log(store, "2026-01-02", 81.0)
+    store.flush()
+
+    assert not store._dirty
+    assert _weights(ExcelStore(filename)) == [80.0, 81.0]
+
+
+def test_read_sheet_returns_a_copy(filename):
+    store = ExcelStore(filename)
+    _log(store, "2026-01-01", 80.0)
+
+    store.read_sheet(Bodyweight.sheet_name())["Weight"] = 0
+    assert _weights(store) == [80.0]
+
+
+def test_external_change_reloads_a_clean_workbook(filename):
+    store = ExcelStore(filename)
+    _log(store, "2026-01-01", 80.0)
+    assert _weights(store) == [80.0]
+
+    other = ExcelStore(filename)
+    _log(other, "2026-01-02", 81.0)
+    other.flush()
+    _bump_mtime(filename)
+
+    assert _weights(store) == [80.0, 81.0]
+
+
+def test_external_change_never_discards_a_dirty_workbook(filename):
+    store = ExcelStore(filename)
+    _log(store, "2026-01-01", 80.0)
+    _log(store, "2026-01-02", 81.0)
+
+    other = ExcelStore(filename)
+    _log(other, "2026-01-03", 99.0)
+    other.flush()
+    _bump_mtime(filename)
+
+    assert _weights(store) == [80.0, 81.0]
+    store.flush()
+    assert _weights(ExcelStore(filename)) == [80.0, 81.0]
+
+
+def test_exit_flushes_and_unregisters_the_atexit_hook(filename, monkeypatch):
+    unregistered = []
+    monkeypatch.setattr(atexit, "unregister", unregistered.append)
+
+    with ExcelStore(filename) as store:
+        _log(store, "2026-01-01", 80.0)
+        _log(store, "2026-01-02", 81.0)
+
+    assert unregistered == [store.flush]
+    assert _weights(ExcelStore(filename)) == [80.0, 81.0]
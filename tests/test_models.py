@@ -0,0 +1,31 @@
+import pytest
+
+from models import Nutrition, parse_bool
+
+
+@pytest.mark.parametrize("value, expected", [
+    (True, True),
+    (False, False),
+    (1, True),
+    (0, False),
+    ("TRUE", True),
+    (" true ", True),
+    ("1", True),
+    ("FALSE", False),
+    ("False", False),
+    ("0", False),
+])
+def test_parse_bool(value, expected):
+    assert parse_bool(value) is expected
+
+
+@pytest.mark.parametrize("value", ["", "yes", "2", 2, None])
+def test_parse_bool_rejects_other_values(value):
+    with pytest.raises(ValueError):
+        parse_bool(value)
+
+
+def test_nutrition_parses_tracked_strings():
+    assert Nutrition("2026-01-01", "2000", 150, 200, 60, "FALSE").tracked is False
+    assert Nutrition("2026-01-01", 2000, 150, 200, 60, "0").tracked is False
+    assert Nutrition("2026-01-01", 2000, 150, 200, 60, "true").tracked is True
@@ -0,0 +1,168 @@
+import os
+from datetime import date, datetime
+
+import pytest
+from openpyxl import Workbook
+
+import main
+import storage
+from models import Bodyweight, Cardio, Nutrition, Workout
+from storage import SQLiteStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    with SQLiteStore(str(tmp_path / "tracker.db")) as s:
+        yield s
+
+
+def _write_xlsx(path, sheets):
+    wb = Workbook()
+    wb.remove(wb.active)
+    for name, rows in sheets.items():
+        ws = wb.create_sheet(name)
+        for row in rows:
+            ws.append(row)
+    wb.save(path)
+
+
+@pytest.mark.parametrize("entry", [
+    Workout("2026-01-01", "Bench", 1, 5, 100.5, "paused"),
+    Cardio("2026-01-02", "run", 30.0, ""),
+    Nutrition("2026-01-03", 2000, 150, 200, 60, True, "cheat day"),
+    Bodyweight("2026-01-04", 80.2),
+])
+def test_round_trip_each_model(store, entry):
+    store.append_rows(entry.sheet_name(), entry.columns(), [entry.to_values()])
+
+    df = store.read_sheet(entry.sheet_name())
+
+    assert list(df.columns) == entry.columns()
+    assert [tuple(row) for row in df.itertuples(index=False)] == [entry.to_values()]
+
+
+def test_bool_column_reads_back_as_bool(store):
+    rows = [
+        Nutrition("2026-01-01", 1, 2, 3, 4, True).to_values(),
+        Nutrition("2026-01-02", 1, 2, 3, 4, False).to_values(),
+    ]
+    store.append_rows(Nutrition.sheet_name(), Nutrition.columns(), rows)
+
+    tracked = store.read_sheet(Nutrition.sheet_name())["Tracked?"]
+
+    assert tracked.dtype == bool
+    assert tracked.tolist() == [True, False]
+
+
+def test_failed_append_is_rolled_back(store):
+    store.append_rows("A", ["Date", "X"], [("2026-01-01", 1)])
+
+    with pytest.raises(Exception):
+        store.append_rows("A", ["Date", "X"], [("2026-01-02", 2), ("2026-01-03",)])
+
+    assert store.read_sheet("A")["X"].tolist() == [1]
+
+
+def test_read_missing_sheet_is_empty(store):
+    assert store.read_sheet("Workouts").empty
+
+
+def test_import_xlsx_with_irregular_headers(store, tmp_path):
+    path = str(tmp_path / "old.xlsx")
+    _write_xlsx(path, {
+        "Workouts": [
+            ["Date", None, "Notes", "notes", None, "Notes"],
+            ["2026-01-01", "Bench", "a", "b", 5, "c"],
+            [None, None, None, None, None, None],
+            ["2026-01-02", "Squat"],
+        ],
+        "Empty": [],
+    })
+
+    store.import_xlsx(path)
+
+    df = store.read_sheet("Workouts")
+    assert list(df.columns) == ["Date", "Column2", "Notes", "notes.1", "Column5", "Notes.2"]
+    assert df["Column2"].tolist() == ["Bench", "Squat"]
+    assert df["Column5"].tolist()[0] == 5
+    assert store.sheet_names() == ["Workouts"]
+
+
+def test_append_after_import_adds_missing_columns(store, tmp_path):
+    path = str(tmp_path / "old.xlsx")
+    _write_xlsx(path, {"Cardio": [["Date", None, "Duration"], ["2026-01-01", "walk", 20]]})
+    store.import_xlsx(path)
+
+    store.append_rows(Cardio.sheet_name(), Cardio.columns(), [Cardio("2026-01-02", "run", 30.0, "ok").to_values()])
+
+    df = store.read_sheet("Cardio")
+    assert list(df.columns) == ["Date", "Column2", "Duration", "Cardio Type", "Notes"]
+    assert df["Cardio Type"].tolist() == [None, "run"]
+    assert df["Notes"].tolist() == [None, "ok"]
+
+
+def test_import_xlsx_stores_dates_as_strings(store, tmp_path):
+    path = str(tmp_path / "old.xlsx")
+    _write_xlsx(path, {"Bodyweight": [
+        ["Date", "Weight"],
+        [datetime(2026, 1, 3), 80.0],
+        [date(2026, 1, 4), 80.5],
+        ["2026-01-02", 81.0],
+    ]})
+
+    store.import_xlsx(path)
+
+    assert store.read_sheet("Bodyweight")["Date"].tolist() == ["2026-01-03", "2026-01-04", "2026-01-02"]
+
+
+def test_export_xlsx_keeps_cell_types(store, tmp_path, monkeypatch):
+    store.append_rows(Nutrition.sheet_name(), Nutrition.columns(), [
+        Nutrition("2026-01-01", 2000, 150, 200, 60, True).to_values(),
+        Nutrition("2026-01-02", 1800, 140, 180, 50, False).to_values(),
+    ])
+    store.append_rows(Bodyweight.sheet_name(), Bodyweight.columns(), [
+        Bodyweight("2026-01-01", 80.5).to_values(),
+    ])
+
+    for writer in {storage.PXWorkbook, None}:
+        monkeypatch.setattr(storage, "PXWorkbook", writer)
+        path = str(tmp_path / "export.xlsx")
+        store.export_xlsx(path)
+
+        wb = storage._load_workbook(path)
+        assert wb.sheetnames == ["Nutrition", "Bodyweight"]
+
+        nutrition = list(wb["Nutrition"].iter_rows(values_only=True))
+        assert nutrition[0] == tuple(Nutrition.columns())
+        assert nutrition[1][:6] == ("2026-01-01", 2000, 150, 200, 60, True)
+        assert nutrition[2][5] is False
+        assert wb["Nutrition"]["F2"].data_type == "b"
+        assert wb["Bodyweight"]["B2"].value == 80.5
+        assert wb["Bodyweight"]["B2"].data_type == "n"
+
+
+def test_open_store_imports_once_and_leaves_xlsx_alone(tmp_path):
+    db_file = str(tmp_path / "tracker.db")
+    excel_file = str(tmp_path / "tracker.xlsx")
+    _write_xlsx(excel_file, {"Bodyweight": [["Date", "Weight", "Notes"], ["2026-01-01", 80.0, None]]})
+    before = os.path.getmtime(excel_file)
+
+    with main.open_store(db_file, excel_file) as s:
+        s.append_rows(Bodyweight.sheet_name(), Bodyweight.columns(), [Bodyweight("2026-01-02", 81.0).to_values()])
+    with main.open_store(db_file, excel_file) as s:
+        weights = s.read_sheet("Bodyweight")["Weight"].tolist()
+
+    assert weights == [80.0, 81.0]
+    assert os.path.getmtime(excel_file) == before
+
+
+def test_open_store_failed_import_leaves_no_database(tmp_path):
+    db_file = str(tmp_path / "tracker.db")
+    excel_file = str(tmp_path / "tracker.xlsx")
+    with open(excel_file, "w") as f:
+        f.write("not an excel file")
+
+    with pytest.raises(Exception):
+        main.open_store(db_file, excel_file)
+
+    assert os.listdir(tmp_path) == ["tracker.xlsx"]
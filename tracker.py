@@ -1,8 +1,8 @@
 import pandas as pd
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
 from models import Workout, Cardio, Nutrition, Bodyweight
-from storage import ExcelStore
+from storage import ExcelStore, SQLiteStore, sort_by_date
 
 
 class FitnessTracker:
@@ -10,14 +10,14 @@ class FitnessTracker:
     Prepares the data to be stored into the excel file.
 
     Attributes: 
-        store (class): The ExcelStore class that operates the excel file including creating, reading, and appending.
+        store (class): The ExcelStore or SQLiteStore class that operates the data file including creating, reading, and appending.
     """
-    def __init__(self, store: ExcelStore):
+    def __init__(self, store: Union[ExcelStore, SQLiteStore]):
         """
         Initializes the storage.
 
         Arguments:
-            store (str): Uses the ExcelStore class to store the user's data into the excel sheets.
+            store (str): Uses the ExcelStore or SQLiteStore class to store the user's data into the excel sheets.
         """
         self.store = store
 
@@ -28,7 +28,7 @@ class FitnessTracker:
         """
         Logs a multi-set exercise entry to the data store.
 
-        This method converts a list of sets into individual row dictionaries and appends them to the workout sheet.
+        This method converts a list of sets into individual rows and appends them to the workout sheet.
 
         Arguments:
             date (str): The date of the session (YYYY-MM-DD).
@@ -38,43 +38,47 @@ class FitnessTracker:
             notes (str, optional): Additional comments for the entire exercise. 
                 Defaults to an empty string.
         """
-        rows = []
-        for i, (reps, weight) in enumerate(sets, start=1):
-            rows.append(
-                Workout(
-                    date=date,
-                    exercise=exercise,
-                    set_number=i,
-                    reps=reps,
-                    weight=weight,
-                    notes=notes
-                ).to_row()
+        self.log_workouts_batch([
+            Workout(
+                date=date,
+                exercise=exercise,
+                set_number=i,
+                reps=reps,
+                weight=weight,
+                notes=notes
             )
+            for i, (reps, weight) in enumerate(sets, start=1)
+        ])
+
+    def log_workouts_batch(self, workouts: List[Workout]) -> None:
+        """
+        Logs many workout sets to the data store in a single append.
+
+        Useful for bulk imports, where appending each set on its own would rewrite the store once per set.
+
+        Arguments:
+            workouts (List[Workout]): The sets to log, in the order they should be stored.
+        """
+        if not workouts:
+            return
 
         self.store.append_rows(
             Workout.sheet_name(),
             Workout.columns(),
-            rows
+            [w.to_values() for w in workouts]
         )
 
     def get_workouts(self) -> pd.DataFrame:
         """
         Retrieves all logged workouts as a cleaned DataFrame.
 
-        Reads the workout sheet and ensures that numeric columns are  properly typed for analysis (handles conversion of SetNumber, Reps, and Weight).
+        Reads the workout sheet as is: the model casts SetNumber, Reps, and Weight to numbers before they are written, so no conversion is needed.
 
         Returns:
             pd.DataFrame: A DataFrame containing all workout history. 
                 Returns an empty DataFrame if no data exists.
         """
-        df = self.store.read_sheet(Workout.sheet_name())
-        if df.empty:
-            return df
-
-        for col in ["SetNumber", "Reps", "Weight"]:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-
-        return df
+        return self.store.read_sheet(Workout.sheet_name())
     
     def show_last_workouts(self):
         """
@@ -105,25 +109,36 @@ class FitnessTracker:
         self.store.append_rows(
             Cardio.sheet_name(),
             Cardio.columns(),
-            [entry.to_row()]
+            [entry.to_values()]
+        )
+
+    def log_cardio_batch(self, entries: List[Cardio]) -> None:
+        """
+        Logs many cardio entries to the data store in a single append.
+
+        Arguments:
+            entries (List[Cardio]): The cardio sessions to log, in the order they should be stored.
+        """
+        if not entries:
+            return
+
+        self.store.append_rows(
+            Cardio.sheet_name(),
+            Cardio.columns(),
+            [e.to_values() for e in entries]
         )
 
     def get_cardio(self) -> pd.DataFrame:
         """
         Retrieves all logged cardio entries as a cleaned DataFrame.
 
-        Reads the workout sheet and ensures that numeric columns are properly typed for analysis (handles conversion of Duration).
+        Reads the cardio sheet as is: the model casts Duration to a number before they are written, so no conversion is needed.
 
         Returns:
             pd.DataFrame: A DataFrame containing all cardio history. 
                 Returns an empty DataFrame if no data exists.
         """
-        df = self.store.read_sheet(Cardio.sheet_name())
-        if df.empty:
-            return df
-
-        df["Duration"] = pd.to_numeric(df["Duration"], errors="coerce")
-        return df
+        return self.store.read_sheet(Cardio.sheet_name())
     
     def show_last_cardio(self):
         """
@@ -156,27 +171,36 @@ class FitnessTracker:
         self.store.append_rows(
             Nutrition.sheet_name(),
             Nutrition.columns(),
-            [entry.to_row()]
+            [entry.to_values()]
+        )
+
+    def log_nutrition_batch(self, entries: List[Nutrition]) -> None:
+        """
+        Logs many nutrition entries to the data store in a single append.
+
+        Arguments:
+            entries (List[Nutrition]): The days of eating to log, in the order they should be stored.
+        """
+        if not entries:
+            return
+
+        self.store.append_rows(
+            Nutrition.sheet_name(),
+            Nutrition.columns(),
+            [e.to_values() for e in entries]
         )
 
     def get_nutrition(self) -> pd.DataFrame:
         """
         Retrieves all logged nutrition entries as a cleaned DataFrame.
 
-        Reads the workout sheet and ensures that numeric columns are properly typed for analysis (handles conversion of Calories, Protein, Carbs, Fats).
+        Reads the nutrition sheet as is: the model casts Calories, Protein, Carbs, Fats to numbers before they are written, so no conversion is needed.
 
         Returns:
             pd.DataFrame: A DataFrame containing all nutrition history. 
                 Returns an empty DataFrame if no data exists.
         """
-        df = self.store.read_sheet(Nutrition.sheet_name())
-        if df.empty:
-            return df
-
-        for col in ["Calories", "Protein", "Carbs", "Fats"]:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-
-        return df
+        return self.store.read_sheet(Nutrition.sheet_name())
     
     def show_last_nutrition(self):
         """
@@ -206,14 +230,30 @@ class FitnessTracker:
         self.store.append_rows(
                 Bodyweight.sheet_name(),
                 Bodyweight.columns(),
-                [entry.to_row()]
+                [entry.to_values()]
+        )
+
+    def add_bodyweight_batch(self, entries: List[Bodyweight]) -> None:
+        """
+        Logs many bodyweight entries to the data store in a single append.
+
+        Arguments:
+            entries (List[Bodyweight]): The weigh-ins to log, in the order they should be stored.
+        """
+        if not entries:
+            return
+
+        self.store.append_rows(
+            Bodyweight.sheet_name(),
+            Bodyweight.columns(),
+            [e.to_values() for e in entries]
         )
 
     def get_bodyweight(self) -> pd.DataFrame:
         """
         Retrieves all logged bodyweights as a cleaned DataFrame.
 
-        Reads the workout sheet and ensures that numeric columns are properly typed for analysis (handles conversion of Weight).
+        Reads the bodyweight sheet as is: the model casts Weight to a number before they are written, so no conversion is needed.
 
         Returns:
             pd.DataFrame: A DataFrame containing all bodyweight history. 
@@ -223,8 +263,7 @@ class FitnessTracker:
         if df.empty:
             return df
 
-        df["Weight"] = pd.to_numeric(df["Weight"], errors="coerce")
-        return df.sort_values("Date")
+        return sort_by_date(df)
 
 
     def show_last_bodyweights(self):